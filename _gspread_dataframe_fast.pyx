@@ -0,0 +1,57 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+_gspread_dataframe_fast
+~~~~~~~~~~~~~~~~~~~~~~~
+
+Optional compiled helpers for gspread_dataframe. When this extension
+is not built, gspread_dataframe falls back to equivalent pure-Python code.
+"""
+from cpython.float cimport PyFloat_Check
+from cpython.long cimport PyLong_Check
+from cpython.unicode cimport PyUnicode_Check
+from numbers import Real
+
+ESCAPE_DEFAULT = 0
+ESCAPE_OFF = 1
+ESCAPE_FULL = 2
+ESCAPE_CALLABLE = 3
+
+cdef extern from "Python.h":
+    Py_ssize_t PyUnicode_GET_LENGTH(object o)
+    Py_UCS4 PyUnicode_READ_CHAR(object o, Py_ssize_t index)
+
+
+def format_object_column(object[:] values,
+                         int mode,
+                         bint allow_formulas,
+                         object escape):
+    """
+    Represent, in place, the non-null values of an object column whose
+    null values have already been replaced with empty strings. Numbers
+    are kept as is, other values are converted to strings, and strings
+    are escaped with a leading apostrophe as determined by the
+    allow_formulas parameter and the escaping mode; escape is the
+    predicate to call when mode is ESCAPE_CALLABLE. Since values is
+    overwritten, it must be a private copy, never a DataFrame's own data.
+    """
+    cdef Py_ssize_t i
+    cdef Py_UCS4 first
+    cdef object value
+    for i in range(values.shape[0]):
+        value = values[i]
+        if PyFloat_Check(value) or PyLong_Check(value):
+            continue
+        if not PyUnicode_Check(value):
+            if isinstance(value, Real):
+                continue
+            value = str(value)
+        if PyUnicode_GET_LENGTH(value) > 0:
+            first = PyUnicode_READ_CHAR(value, 0)
+            if (
+                (not allow_formulas and first == u"=")
+                or (mode == ESCAPE_DEFAULT and first == u"'")
+                or mode == ESCAPE_FULL
+                or (mode == ESCAPE_CALLABLE and escape(value))
+            ):
+                value = u"'" + value
+        values[i] = value
@@ -7,65 +7,101 @@ gspread_dataframe
 This module contains functions to retrieve a gspread worksheet as a
 `pandas.DataFrame`, and to set the contents of a worksheet
 using a `pandas.DataFrame`. To use these functions, have
-Pandas 0.14.0 or greater installed.
+Pandas 0.24.0 or greater installed.
 """
-from gspread.utils import fill_gaps
-from gspread.models import Cell
+from gspread.utils import fill_gaps, rowcol_to_a1, absolute_range_name
+from gspread.urls import (
+    SPREADSHEET_VALUES_URL,
+    SPREADSHEET_VALUES_BATCH_UPDATE_URL,
+)
+import numpy as np
 import pandas as pd
 from pandas.io.parsers import TextParser
 import logging
-import re
 from numbers import Real
-from six import string_types, ensure_text
+from urllib.parse import quote
 
 try:
-    from collections.abc import defaultdict
+    import _gspread_dataframe_fast
 except ImportError:
-    from collections import defaultdict
+    _gspread_dataframe_fast = None
 try:
-    from itertools import chain, zip_longest
+    import orjson
 except ImportError:
-    from itertools import chain, izip_longest as zip_longest
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 # pandas version check
 
-major, minor = tuple(
-    [int(i) for i in re.search(r"^(\d+)\.(\d+)\..+$", pd.__version__).groups()]
-)
-if (major, minor) < (0, 14):
+_pandas_version = tuple(int(i) for i in pd.__version__.split(".", 2)[:2])
+if _pandas_version < (0, 24):
     raise ImportError(
-        "pandas version too old (<0.14.0) to support gspread_dataframe"
+        "pandas version too old (<0.24.0) to support gspread_dataframe"
     )
 logger.debug(
-    "Imported satisfactory (>=0.14.0) Pandas module: %s", pd.__version__
+    "Imported satisfactory (>=0.24.0) Pandas module: %s", pd.__version__
 )
 
+# keeps each request's payload to a few megabytes
+_MAX_CELLS_PER_REQUEST = 500000
+
 __all__ = ("set_with_dataframe", "get_as_dataframe")
 
 
-def _escaped_string(value, string_escaping):
-    if value in (None, ""):
-        return ""
-    if string_escaping == "default":
-        if value.startswith("'"):
-            return "'%s" % value
-    elif string_escaping == "off":
-        return value
-    elif string_escaping == "full":
-        return "'%s" % value
-    elif callable(string_escaping):
-        if string_escaping(value):
-            return "'%s" % value
-    else:
+def _escape_default(value):
+    return value.startswith("'")
+
+
+def _escape_off(value):
+    return False
+
+
+def _escape_full(value):
+    return True
+
+
+_STRING_ESCAPING_PREDICATES = {
+    "default": _escape_default,
+    "off": _escape_off,
+    "full": _escape_full,
+}
+
+
+def _string_escaping_predicate(string_escaping):
+    """
+    Resolve a string_escaping parameter value to a predicate that tells
+    whether a string value must be escaped. Resolving once per call,
+    rather than once per cell, keeps the mode dispatch out of the
+    inner loops.
+    """
+    if callable(string_escaping):
+        return string_escaping
+    try:
+        return _STRING_ESCAPING_PREDICATES[string_escaping]
+    except (KeyError, TypeError):
         raise ValueError(
             "string_escaping parameter must be one of: "
             "'default', 'off', 'full', any callable taking one parameter"
         )
+
+
+def _escaped_string(value, string_escaping):
+    if value in (None, ""):
+        return ""
+    if _string_escaping_predicate(string_escaping)(value):
+        return "'%s" % value
     return value
 
 
+def _non_finite_error(value):
+    # infinities have no JSON representation; json would emit Infinity,
+    # which the Sheets API rejects, and orjson would silently emit null.
+    return ValueError(
+        "cannot write non-finite number %r to a worksheet" % (value,)
+    )
+
+
 def _cellrepr(value, allow_formulas, string_escaping):
     """
     Get a string representation of dataframe value.
@@ -75,21 +111,321 @@ def _cellrepr(value, allow_formulas, string_escaping):
             to be interpreted as formulas; otherwise, escape
             them with an apostrophe to avoid formula interpretation.
     """
-    if pd.isnull(value) is True:
+    if value is None or value is pd.NaT:
         return ""
     if isinstance(value, Real):
+        # NaN is the only value not equal to itself
+        if value != value:
+            return ""
+        if value in (np.inf, -np.inf):
+            raise _non_finite_error(value)
         return value
-    if not isinstance(value, string_types):
+    if not isinstance(value, str):
+        if pd.isnull(value) is True:
+            return ""
         value = str(value)
 
-    value = ensure_text(value, encoding='utf-8')
-
     if (not allow_formulas) and value.startswith("="):
         return "'%s" % value
     else:
         return _escaped_string(value, string_escaping)
 
 
+# bits of the code summarizing each text value for _escape_mask
+_NONEMPTY = 1
+_STARTS_WITH_EQUALS = 2
+_STARTS_WITH_APOSTROPHE = 4
+
+
+def _escape_table(escape, allow_formulas):
+    """
+    Build the lookup table that maps each code computed by _escape_mask
+    to whether a text value with that code must be escaped, for the
+    built-in escaping predicates and the allow_formulas parameter.
+    """
+    codes = np.arange(8)
+    table = np.zeros(len(codes), dtype=bool)
+    if escape is _escape_default:
+        table |= (codes & _STARTS_WITH_APOSTROPHE) > 0
+    elif escape is _escape_full:
+        table |= (codes & _NONEMPTY) > 0
+    if not allow_formulas:
+        table |= (codes & _STARTS_WITH_EQUALS) > 0
+    return table
+
+
+def _escape_mask(text, string_escaping, allow_formulas):
+    """
+    Get a boolean mask of the values in a text array that must be
+    escaped according to the string_escaping and allow_formulas
+    parameters. Empty strings are never escaped.
+
+    Each value is summarized by a code packing the bits that decide its
+    escaping, computed from the array of first characters in one pass;
+    the mask is then a single lookup of the codes in _escape_table.
+    """
+    escape = _string_escaping_predicate(string_escaping)
+    first = text.astype("U1").view(np.uint32)
+    nonempty = text != ""
+    code = (
+        nonempty.view(np.uint8)
+        | ((first == ord("=")).view(np.uint8) << 1)
+        | ((first == ord("'")).view(np.uint8) << 2)
+    )
+    mask = _escape_table(escape, allow_formulas)[code]
+    if escape not in (_escape_default, _escape_off, _escape_full):
+        mask[nonempty] |= np.array(
+            [bool(escape(value)) for value in text[nonempty]], dtype=bool
+        )
+    return mask
+
+
+def _cellrepr_column(column, allow_formulas, string_escaping):
+    """
+    Get the representations of a whole column of dataframe values,
+    as an object ndarray. Equivalent to calling `_cellrepr` on
+    each value in the column.
+
+    :param :column: the pandas Series or Index to represent
+    :param :allow_formulas: if True, allow values starting with '='
+            to be interpreted as formulas; otherwise, escape
+            them with an apostrophe to avoid formula interpretation.
+    """
+    isnull = np.asarray(pd.isnull(column))
+    # always copy: for object columns and indexes, to_numpy would
+    # otherwise return the caller's own data, which is modified below
+    values = column.to_numpy(dtype=object, copy=True)
+    values[isnull] = ""
+    kind = column.dtype.kind
+    if kind == "f":
+        infinite = (values == np.inf) | (values == -np.inf)
+    elif kind not in "biumM":
+        infinite = np.array(
+            [
+                isinstance(value, (float, np.floating)) and np.isinf(value)
+                for value in values
+            ],
+            dtype=bool,
+        )
+    else:
+        infinite = None
+    if infinite is not None and infinite.any():
+        raise _non_finite_error(values[infinite][0])
+    if kind in "biuf":
+        return values
+
+    if _gspread_dataframe_fast is not None:
+        fast = _gspread_dataframe_fast
+        escape = _string_escaping_predicate(string_escaping)
+        mode = {
+            _escape_default: fast.ESCAPE_DEFAULT,
+            _escape_off: fast.ESCAPE_OFF,
+            _escape_full: fast.ESCAPE_FULL,
+        }.get(escape, fast.ESCAPE_CALLABLE)
+        fast.format_object_column(values, mode, allow_formulas, escape)
+        return values
+
+    if kind in "mM":
+        is_text = ~isnull
+        text = [str(value) for value in values[is_text]]
+    else:
+        is_text = ~isnull & np.array(
+            [not isinstance(value, Real) for value in values], dtype=bool
+        )
+        text = [
+            value if isinstance(value, str) else str(value)
+            for value in values[is_text]
+        ]
+    if not text:
+        return values
+
+    text = np.array(text, dtype=object)
+    escape = _escape_mask(text, string_escaping, allow_formulas)
+    text[escape] = "'" + text[escape]
+    values[is_text] = text
+    return values
+
+
+def _is_numeric_dtype(dtype):
+    return isinstance(dtype, np.dtype) and dtype.kind in "biuf"
+
+
+def _numeric_blocks(dataframe):
+    """
+    Group the positions of a DataFrame's numeric and boolean columns
+    by their NumPy dtype.
+    """
+    blocks = {}
+    for x_idx, dtype in enumerate(dataframe.dtypes):
+        if _is_numeric_dtype(dtype):
+            blocks.setdefault(dtype, []).append(x_idx)
+    return blocks
+
+
+def _numeric_block_values(block):
+    """
+    Get the values of a DataFrame whose columns all share one numeric
+    NumPy dtype as a 2-D object ndarray, with nulls represented as empty
+    strings. The block is read in its native dtype, so it is never
+    upcast along with columns of other dtypes.
+    """
+    native = block.to_numpy()
+    # pandas stores columns contiguously, so native is usually in Fortran
+    # order; converting straight to C order keeps the rows read out when
+    # building the payload contiguous without a separate copy.
+    values = native.astype(object, order="C")
+    if native.dtype.kind == "f":
+        infinite = np.isinf(native)
+        if infinite.any():
+            raise _non_finite_error(native[infinite][0])
+        values[np.isnan(native)] = ""
+    return values
+
+
+def _dataframe_values(dataframe,
+                      include_index,
+                      include_column_header,
+                      allow_formulas,
+                      string_escaping):
+    """
+    Get the represented values of a DataFrame, including its header row
+    and index columns as requested, as a 2-D object ndarray. The array
+    is allocated once at its final size, and each column, or block of
+    same-dtype numeric columns, is represented in its own dtype and
+    assigned into its slice.
+    """
+    numeric_blocks = _numeric_blocks(dataframe)
+    all_numeric = (
+        len(numeric_blocks) == 1
+        and len(next(iter(numeric_blocks.values()))) == dataframe.shape[1]
+    )
+    if all_numeric and not include_index and not include_column_header:
+        # nothing but numbers: no buffer, no per-column work
+        return _numeric_block_values(dataframe)
+
+    index_columns = []
+    header = list(dataframe.columns)
+    if include_index:
+        index = dataframe.index
+        index_columns = [
+            index.get_level_values(i) for i in range(index.nlevels)
+        ]
+        header = list(index.names) + header
+
+    header_rows = 1 if include_column_header else 0
+    width = len(index_columns)
+    values = np.empty(
+        (header_rows + len(dataframe), width + dataframe.shape[1]),
+        dtype=object,
+    )
+    if include_column_header:
+        values[0, :] = [
+            _cellrepr(value, allow_formulas, string_escaping)
+            for value in header
+        ]
+    body = values[header_rows:]
+    for x_idx, column in enumerate(index_columns):
+        body[:, x_idx] = _cellrepr_column(
+            column, allow_formulas, string_escaping
+        )
+
+    if all_numeric:
+        body[:, width:] = _numeric_block_values(dataframe)
+        return values
+
+    # body columns sharing a numeric dtype are represented together,
+    # as one block; all others are represented column by column.
+    for x_idx, dtype in enumerate(dataframe.dtypes):
+        if not _is_numeric_dtype(dtype):
+            body[:, width + x_idx] = _cellrepr_column(
+                dataframe.iloc[:, x_idx], allow_formulas, string_escaping
+            )
+    for positions in numeric_blocks.values():
+        body[:, [width + x_idx for x_idx in positions]] = (
+            _numeric_block_values(dataframe.iloc[:, positions])
+        )
+    return values
+
+
+def _value_chunks(worksheet, values, row, col):
+    """
+    Split a 2-D array of values anchored at (row, col) into chunks of
+    whole rows holding at most _MAX_CELLS_PER_REQUEST cells, and yield
+    the A1 range and the list of lists of values of each chunk. Each
+    chunk's lists are only built when the chunk is reached, so a large
+    DataFrame is never held as lists of values all at once.
+    """
+    chunk_rows = max(1, _MAX_CELLS_PER_REQUEST // values.shape[1])
+    for start in range(0, values.shape[0], chunk_rows):
+        chunk = values[start:start + chunk_rows]
+        range_name = absolute_range_name(
+            worksheet.title,
+            "%s:%s" % (
+                rowcol_to_a1(row + start, col),
+                rowcol_to_a1(
+                    row + start + chunk.shape[0] - 1,
+                    col + chunk.shape[1] - 1,
+                ),
+            ),
+        )
+        yield range_name, chunk.tolist()
+
+
+def _orjson_dumps(body):
+    """
+    Serialize a request body with orjson, which encodes large bodies of
+    values several times faster than the json module that gspread
+    otherwise uses. Returns None if orjson is not installed or cannot
+    encode the body (e.g. integers beyond 64 bits), in which case the
+    body is left to gspread.
+    """
+    if orjson is None:
+        return None
+    try:
+        return orjson.dumps(body, option=orjson.OPT_SERIALIZE_NUMPY)
+    except orjson.JSONEncodeError:
+        return None
+
+
+def _send_json(worksheet, method, url, params, data):
+    response = worksheet.spreadsheet.client.request(
+        method,
+        url,
+        params=params,
+        data=data,
+        headers={"Content-Type": "application/json"},
+    )
+    return response.json()
+
+
+def _update_values(worksheet, range_name, values):
+    params = {"valueInputOption": "USER_ENTERED"}
+    body = {"values": values}
+    data = _orjson_dumps(body)
+    if data is None:
+        resp = worksheet.spreadsheet.values_update(
+            range_name, params=params, body=body
+        )
+    else:
+        url = SPREADSHEET_VALUES_URL % (
+            worksheet.spreadsheet.id,
+            quote(range_name, safe=""),
+        )
+        resp = _send_json(worksheet, "put", url, params, data)
+    logger.debug("Cell update response: %s", resp)
+
+
+def _batch_update_values(worksheet, data):
+    body = {"valueInputOption": "USER_ENTERED", "data": data}
+    data = _orjson_dumps(body)
+    if data is None:
+        resp = worksheet.spreadsheet.values_batch_update(body=body)
+    else:
+        url = SPREADSHEET_VALUES_BATCH_UPDATE_URL % worksheet.spreadsheet.id
+        resp = _send_json(worksheet, "post", url, None, data)
+    logger.debug("Cell update response: %s", resp)
+
+
 def _resize_to_minimum(worksheet, rows=None, cols=None):
     """
     Resize the worksheet to guarantee a minimum size, either in rows,
@@ -108,7 +444,7 @@ def _resize_to_minimum(worksheet, rows=None, cols=None):
         worksheet.resize(rows, cols)
 
 
-def _get_all_values(worksheet, evaluate_formulas):
+def _get_all_values(worksheet, evaluate_formulas, pad_to_sheet=False):
     data = worksheet.spreadsheet.values_get(
         worksheet.title,
         params={
@@ -118,39 +454,25 @@ def _get_all_values(worksheet, evaluate_formulas):
             "dateTimeRenderOption": "FORMATTED_STRING",
         },
     )
-    (row_offset, column_offset) = (1, 1)
-    (last_row, last_column) = (worksheet.row_count, worksheet.col_count)
     values = data.get("values", [])
 
-    rect_values = fill_gaps(
-        values,
-        rows=last_row - row_offset + 1,
-        cols=last_column - column_offset + 1,
-    )
-
-    cells = [
-        Cell(row=i + row_offset, col=j + column_offset, value=value)
-        for i, row in enumerate(rect_values)
-        for j, value in enumerate(row)
-    ]
-
-    # defaultdicts fill in gaps for empty rows/cells not returned by gdocs
-    rows = defaultdict(lambda: defaultdict(str))
-    for cell in cells:
-        row = rows.setdefault(int(cell.row), defaultdict(str))
-        row[cell.col] = cell.value
-
-    if not rows:
-        return []
-
-    all_row_keys = chain.from_iterable(row.keys() for row in rows.values())
-    rect_cols = range(1, max(all_row_keys) + 1)
-    rect_rows = range(1, max(rows.keys()) + 1)
+    if pad_to_sheet:
+        return fill_gaps(
+            values, rows=worksheet.row_count, cols=worksheet.col_count
+        )
 
-    return [[rows[i][j] for j in rect_cols] for i in rect_rows]
+    # the API omits trailing empty cells from each row; pad the rows
+    # only out to the widest one returned.
+    width = max((len(row) for row in values), default=0)
+    for row in values:
+        row.extend([""] * (width - len(row)))
+    return values
 
 
-def get_as_dataframe(worksheet, evaluate_formulas=False, **options):
+def get_as_dataframe(worksheet,
+                     evaluate_formulas=False,
+                     pad_to_sheet=False,
+                     **options):
     r"""
     Returns the worksheet contents as a DataFrame.
 
@@ -158,28 +480,23 @@ def get_as_dataframe(worksheet, evaluate_formulas=False, **options):
     :param evaluate_formulas: if True, get the value of a cell after
             formula evaluation; otherwise get the formula itself if present.
             Defaults to False.
+    :param pad_to_sheet: if True, pad the contents with empty cells out to
+            the worksheet's full row and column count; otherwise the
+            contents extend only to the last non-empty row and column.
+            Defaults to False.
     :param \*\*options: all the options for pandas.io.parsers.TextParser,
             according to the version of pandas that is installed.
             (Note: TextParser supports only the default 'python' parser engine,
             not the C engine.)
     :returns: pandas.DataFrame
     """
-    all_values = _get_all_values(worksheet, evaluate_formulas)
+    all_values = _get_all_values(worksheet, evaluate_formulas, pad_to_sheet)
+    if not all_values:
+        # TextParser cannot parse an empty worksheet
+        return pd.DataFrame()
     return TextParser(all_values, **options).read(options.get("nrows", None))
 
 
-def _determine_index_column_size(index):
-    if hasattr(index, "levshape"):
-        return len(index.levshape)
-    return 1
-
-
-def _determine_column_header_size(columns):
-    if hasattr(columns, "levshape"):
-        return len(columns.levshape)
-    return 1
-
-
 def set_with_dataframe(worksheet,
                        dataframe,
                        row=1,
@@ -222,60 +539,34 @@ def set_with_dataframe(worksheet,
             is unaffected by this parameter's value. 
             Default value is `'default'`.
     """
-    # x_pos, y_pos refers to the position of data rows only,
-    # excluding any header rows in the google sheet.
-    # If header-related params are True, the values are adjusted
-    # to allow space for the headers.
-
-    updates = []
-
-    if include_column_header:
-        elts = list(dataframe.columns)
-            
-        if include_index:
-            if hasattr(dataframe.index, 'names'):
-                index_elts = dataframe.index.names
-            else:
-                index_elts = dataframe.index.name
-            if not isinstance(index_elts, (list, tuple)):
-                index_elts = [ index_elts ]
-            elts = list(index_elts) + elts
-        for idx, val in enumerate(elts):
-            updates.append(
-                (row,
-                    col+idx,
-                    _cellrepr(val, allow_formulas, string_escaping))
-            )
-        row += 1
-
-    values = []
-    for value_row, index_value in zip_longest(dataframe.values, dataframe.index):
-        if include_index:
-            if not isinstance(index_value, (list, tuple)):
-                index_value = [ index_value ]
-            value_row = list(index_value) + list(value_row)
-        values.append(value_row)
-    for y_idx, value_row in enumerate(values):
-        for x_idx, cell_value in enumerate(value_row):
-            updates.append(
-                (y_idx+row,
-                 x_idx+col,
-                 _cellrepr(cell_value, allow_formulas, string_escaping))
-            )
-
-    if not updates:
+    string_escaping = _string_escaping_predicate(string_escaping)
+
+    values = _dataframe_values(
+        dataframe,
+        include_index,
+        include_column_header,
+        allow_formulas,
+        string_escaping,
+    )
+    if not values.size:
         logger.debug("No updates to perform on worksheet.")
         return
 
-    cells_to_update = [ Cell(row, col, value) for row, col, value in updates ]
-    logger.debug("%d cell updates to send", len(cells_to_update))
+    # y, x are the last row and column the dataframe will occupy
+    y, x = row + values.shape[0] - 1, col + values.shape[1] - 1
+    if resize:
+        worksheet.resize(y, x)
+    else:
+        _resize_to_minimum(worksheet, y, x)
+
+    logger.debug("%d cell updates to send", values.size)
+    for range_name, chunk in _value_chunks(worksheet, values, row, col):
+        _update_values(worksheet, range_name, chunk)
+
 
-    resp = worksheet.update_cells(cells_to_update, value_input_option='USER_ENTERED')
-    logger.debug("Cell update response: %s", resp)
-    
 def set_with_dataframes(worksheet,
                        dataframe_list,
-                       row_list=1,
+                       row_list=None,
                        col=1,
                        include_index=False,
                        include_column_header=True,
@@ -283,18 +574,23 @@ def set_with_dataframes(worksheet,
                        allow_formulas=True,
                        string_escaping='default'):
     """
-    Sets the values of a given DataFrame, anchoring its upper-left corner
-    at (row, col). (Default is row 1, column 1.)
-
-    :param worksheet: the gspread worksheet to set with content of DataFrame.
-    :param dataframe: the DataFrame.
+    Sets the values of several DataFrames, anchoring the upper-left corner
+    of each at (row, col), where row is taken from row_list in the same
+    order as dataframe_list. The DataFrames are sent together, in as few
+    requests as the per-request size limit allows.
+
+    :param worksheet: the gspread worksheet to set with content of DataFrames.
+    :param dataframe_list: the DataFrames.
+    :param row_list: the row at which to anchor each DataFrame. If None,
+            the DataFrames are stacked one directly below another,
+            starting at row 1. Defaults to None.
     :param include_index: if True, include the DataFrame's index as an
             additional column. Defaults to False.
     :param include_column_header: if True, add a header row or rows before data with
             column names. (If include_index is True, the index's name(s) will be
             used as its columns' headers.) Defaults to True.
     :param resize: if True, changes the worksheet's size to match the shape
-            of the provided DataFrame. If False, worksheet will only be
+            of the provided DataFrames. If False, worksheet will only be
             resized as necessary to contain the DataFrame contents.
             Defaults to False.
     :param allow_formulas: if True, interprets `=foo` as a formula in
@@ -315,52 +611,49 @@ def set_with_dataframes(worksheet,
             is unaffected by this parameter's value. 
             Default value is `'default'`.
     """
-    # x_pos, y_pos refers to the position of data rows only,
-    # excluding any header rows in the google sheet.
-    # If header-related params are True, the values are adjusted
-    # to allow space for the headers.
+    string_escaping = _string_escaping_predicate(string_escaping)
     updates = []
+    next_row = 1
+    if row_list is None:
+        row_list = [None] * len(dataframe_list)
     for dataframe, row in zip(dataframe_list, row_list):
-        elts = list(dataframe.columns)
-            
-        if include_index:
-            if hasattr(dataframe.index, 'names'):
-                index_elts = dataframe.index.names
-            else:
-                index_elts = dataframe.index.name
-            if not isinstance(index_elts, (list, tuple)):
-                index_elts = [ index_elts ]
-            elts = list(index_elts) + elts
-        for idx, val in enumerate(elts):
-            updates.append(
-                (row,
-                    col+idx,
-                    _cellrepr(val, allow_formulas, string_escaping))
-            )
-        row += 1
-
-        values = []
-        for value_row, index_value in zip_longest(dataframe.values, dataframe.index):
-            if include_index:
-                if not isinstance(index_value, (list, tuple)):
-                    index_value = [ index_value ]
-                value_row = list(index_value) + list(value_row)
-            values.append(value_row)
-        for y_idx, value_row in enumerate(values):
-            for x_idx, cell_value in enumerate(value_row):
-                updates.append(
-                    (y_idx+row,
-                    x_idx+col,
-                    _cellrepr(cell_value, allow_formulas, string_escaping))
-                )
+        values = _dataframe_values(
+            dataframe,
+            include_index,
+            include_column_header,
+            allow_formulas,
+            string_escaping,
+        )
+        if row is None:
+            row = next_row
+            next_row += values.shape[0]
+        if values.size:
+            updates.append((row, values))
 
     if not updates:
         logger.debug("No updates to perform on worksheet.")
         return
 
-    cells_to_update = [ Cell(row, col, value) for row, col, value in updates ]
-    logger.debug("%d cell updates to send", len(cells_to_update))
+    # y, x are the last row and column any of the dataframes will occupy
+    y = max(row + values.shape[0] - 1 for row, values in updates)
+    x = max(col + values.shape[1] - 1 for _, values in updates)
+    if resize:
+        worksheet.resize(y, x)
+    else:
+        _resize_to_minimum(worksheet, y, x)
 
-    resp = worksheet.update_cells(cells_to_update, value_input_option='USER_ENTERED')
-    logger.debug("Cell update response: %s", resp)
+    logger.debug(
+        "%d cell updates to send", sum(values.size for _, values in updates)
+    )
+    # ranges from all dataframes share a request, up to the cell limit
+    data, cells = [], 0
+    for row, values in updates:
+        for range_name, chunk in _value_chunks(worksheet, values, row, col):
+            chunk_cells = len(chunk) * len(chunk[0])
+            if data and cells + chunk_cells > _MAX_CELLS_PER_REQUEST:
+                _batch_update_values(worksheet, data)
+                data, cells = [], 0
+            data.append({"range": range_name, "values": chunk})
+            cells += chunk_cells
+    _batch_update_values(worksheet, data)
 
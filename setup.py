@@ -1,35 +1,58 @@
 try:
-    from setuptools import setup
+    from setuptools import setup, Extension
+    from setuptools.command.build_ext import build_ext
 except ImportError:
-    from distutils.core import setup
+    from distutils.core import setup, Extension
+    from distutils.command.build_ext import build_ext
 
 import os.path
 import sys
 
-PY3 = sys.version_info >= (3, 0)
-
 with open(os.path.join(os.path.dirname(__file__), 'VERSION'), 'rb') as f:
-    VERSION = f.read()
-    if PY3:
-        VERSION = VERSION.decode('utf8')
-    VERSION = VERSION.strip()
+    VERSION = f.read().decode('utf8').strip()
 
 with open(os.path.join(os.path.dirname(__file__), 'README.rst'), 'rb') as f:
-    long_description = f.read()
-    if PY3:
-        long_description = long_description.decode('utf8')
+    long_description = f.read().decode('utf8')
+
+# The compiled helpers are optional: they are built only when Cython is
+# available, and gspread_dataframe falls back to pure Python without them.
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        [Extension('_gspread_dataframe_fast', ['_gspread_dataframe_fast.pyx'])]
+    )
+except ImportError:
+    ext_modules = []
+
+
+class optional_build_ext(build_ext):
+    def run(self):
+        try:
+            build_ext.run(self)
+        except Exception as e:
+            sys.stderr.write('Not building optional extensions: %s\n' % e)
+
+    def build_extension(self, ext):
+        try:
+            build_ext.build_extension(self, ext)
+        except Exception as e:
+            sys.stderr.write('Not building %s: %s\n' % (ext.name, e))
+
 
 setup(
     name='gspread-dataframe',
     version=VERSION,
     py_modules=['gspread_dataframe'],
+    ext_modules=ext_modules,
+    cmdclass={'build_ext': optional_build_ext},
     test_suite='tests',
     install_requires=[
-        'gspread>=3.0.0', 
-        'pandas>=0.14.0',
-        'six>=1.12.0'
+        'gspread>=3.3.0',
+        'pandas>=0.24.0'
         ],
-    tests_require=['oauth2client'] + ([] if PY3 else ['mock']),
+    extras_require={'orjson': ['orjson']},
+    python_requires='>=3',
+    tests_require=['oauth2client'],
     description='Read/write gspread worksheets using pandas DataFrames',
     long_description=long_description,
     author='Robin Thomas',
@@ -48,5 +71,5 @@ setup(
         "Topic :: Office/Business :: Financial :: Spreadsheet",
         "Topic :: Software Development :: Libraries :: Python Modules"
         ],
-    zip_safe=True
+    zip_safe=False
 )
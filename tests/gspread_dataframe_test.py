@@ -6,9 +6,15 @@ from .mock_worksheet import (
     CELL_LIST_STRINGIFIED_NO_THINGY,
 )
 
-from gspread_dataframe import get_as_dataframe, set_with_dataframe
+from gspread_dataframe import (
+    get_as_dataframe,
+    set_with_dataframe,
+    set_with_dataframes,
+)
 from gspread_dataframe import _escaped_string as escape, _cellrepr as cellrepr
-from gspread.models import Cell
+from gspread_dataframe import _cellrepr_column as cellrepr_column
+from gspread_dataframe import _numeric_block_values as numeric_block_values
+import gspread_dataframe
 import numpy as np
 import pandas as pd
 from difflib import SequenceMatcher
@@ -16,10 +22,11 @@ from difflib import SequenceMatcher
 import unittest
 
 try:
-    from unittest.mock import Mock, MagicMock
+    from unittest.mock import Mock, MagicMock, call, patch
 except ImportError:
-    from mock import Mock, MagicMock
+    from mock import Mock, MagicMock, call, patch
 from datetime import datetime
+import json
 import re
 
 # Expected results
@@ -100,10 +107,86 @@ class TestStringEscaping(unittest.TestCase):
             (),
         )
 
+    def test_null_cellrepr(self):
+        values = [None, np.nan, pd.NaT, np.datetime64("NaT")]
+        if hasattr(pd, "NA"):  # pandas >= 1.0
+            values.append(pd.NA)
+        for value in values:
+            self.assertEqual(cellrepr(value, True, "default"), "")
+
     def test_formula_cellrepr_when_no_formulas_allowed(self):
         self.assertEqual(cellrepr("=A1", allow_formulas=False, string_escaping="default"), "'=A1")
 
 
+class TestColumnRepresentation(unittest.TestCase):
+    COLUMN = pd.Series(
+        [None, "", "foo", "'foo", "=A1", "'=A1", 1, 2.5, np.nan, [1, 2]]
+    )
+
+    @patch("gspread_dataframe._gspread_dataframe_fast", None)
+    def _assert_same_as_cellrepr(self, allow_formulas, string_escaping):
+        self.assertEqual(
+            cellrepr_column(
+                self.COLUMN, allow_formulas, string_escaping
+            ).tolist(),
+            [
+                cellrepr(value, allow_formulas, string_escaping)
+                for value in self.COLUMN
+            ],
+        )
+
+    def test_default(self):
+        self._assert_same_as_cellrepr(True, "default")
+
+    def test_full(self):
+        self._assert_same_as_cellrepr(True, "full")
+
+    def test_off(self):
+        self._assert_same_as_cellrepr(True, "off")
+
+    def test_no_formulas_allowed(self):
+        for string_escaping in ("default", "full", "off"):
+            self._assert_same_as_cellrepr(False, string_escaping)
+
+    def test_callable(self):
+        self._assert_same_as_cellrepr(False, re.compile(r"f").match)
+
+
+@unittest.skipIf(
+    gspread_dataframe._gspread_dataframe_fast is None,
+    "compiled helpers not built",
+)
+class TestCompiledColumnRepresentation(unittest.TestCase):
+    COLUMN = pd.Series(
+        [None, "", "foo", "'foo", "=A1", 1, 2.5, np.nan, True, [1, 2]]
+    )
+
+    def _assert_same_as_pure_python(self, allow_formulas, string_escaping):
+        fast = cellrepr_column(self.COLUMN, allow_formulas, string_escaping)
+        with patch("gspread_dataframe._gspread_dataframe_fast", None):
+            pure = cellrepr_column(
+                self.COLUMN, allow_formulas, string_escaping
+            )
+        self.assertEqual(fast.tolist(), pure.tolist())
+
+    def test_same_as_pure_python(self):
+        for allow_formulas in (True, False):
+            for string_escaping in (
+                "default", "off", "full", re.compile(r"f").match
+            ):
+                self._assert_same_as_pure_python(
+                    allow_formulas, string_escaping
+                )
+
+
+class TestNumericBlockValues(unittest.TestCase):
+    def test_row_major_from_column_major_storage(self):
+        df = pd.DataFrame({"a": [1.0, np.nan, 3.0], "b": [4.0, 5.0, 6.0]})
+        values = numeric_block_values(df)
+        self.assertTrue(values.flags.c_contiguous)
+        self.assertEqual(values.tolist(), [[1.0, 4.0], ["", 5.0], [3.0, 6.0]])
+
+
 class TestWorksheetReads(unittest.TestCase):
     def setUp(self):
         self.sheet = MockWorksheet()
@@ -217,6 +300,25 @@ class TestWorksheetReads(unittest.TestCase):
         )
         self.assertEqual(df["Date Column"][0], datetime(2017, 3, 4))
 
+    def test_tight_extent_by_default(self):
+        self.sheet.row_count = 15
+        self.sheet.col_count = 12
+        df = get_as_dataframe(self.sheet)
+        self.assertEqual(df.shape, (9, 10))
+
+    def test_empty_worksheet(self):
+        self.sheet.spreadsheet.values_get = MagicMock(
+            return_value={"range": "A1:J10", "majorDimension": "ROWS"}
+        )
+        df = get_as_dataframe(self.sheet)
+        self.assertTrue(df.empty)
+
+    def test_pad_to_sheet(self):
+        self.sheet.row_count = 15
+        self.sheet.col_count = 12
+        df = get_as_dataframe(self.sheet, pad_to_sheet=True)
+        self.assertEqual(df.shape, (14, 12))
+
 
 _original_mock_failure_message = Mock._format_mock_failure_message
 
@@ -250,26 +352,23 @@ def _format_mock_failure_message(self, args, kwargs):
 
 Mock._format_mock_failure_message = _format_mock_failure_message
 
-# have to patch Cell to make cells comparable
-def __eq__(self, other):
-    if not isinstance(other, self.__class__):
-        return False
-    return (
-        self.row == other.row
-        and self.col == other.col
-        and self.value == other.value
-    )
-
-
-Cell.__eq__ = __eq__
-
 
 class TestWorksheetWrites(unittest.TestCase):
     def setUp(self):
+        orjson_patcher = patch("gspread_dataframe.orjson", None)
+        orjson_patcher.start()
+        self.addCleanup(orjson_patcher.stop)
         self.sheet = MockWorksheet()
         self.sheet.resize = MagicMock()
-        self.sheet.update_cells = MagicMock()
         self.sheet.spreadsheet.values_update = MagicMock()
+        self.sheet.spreadsheet.values_batch_update = MagicMock()
+
+    def assert_values_updated(self, range_name, values):
+        self.sheet.spreadsheet.values_update.assert_called_once_with(
+            range_name,
+            params={"valueInputOption": "USER_ENTERED"},
+            body={"values": values},
+        )
 
     def test_write_basic(self):
         df = get_as_dataframe(self.sheet, na_filter=False)
@@ -280,8 +379,8 @@ class TestWorksheetWrites(unittest.TestCase):
             string_escaping=re.compile(r"3e50").match,
         )
         self.sheet.resize.assert_called_once_with(10, 10)
-        self.sheet.update_cells.assert_called_once_with(
-            CELL_LIST_STRINGIFIED, value_input_option="USER_ENTERED"
+        self.assert_values_updated(
+            "'gspread dataframe test'!A1:J10", CELL_LIST_STRINGIFIED
         )
 
     def test_include_index_false(self):
@@ -295,8 +394,8 @@ class TestWorksheetWrites(unittest.TestCase):
             string_escaping=lambda x: x == "3e50",
         )
         self.sheet.resize.assert_called_once_with(10, 9)
-        self.sheet.update_cells.assert_called_once_with(
-            CELL_LIST_STRINGIFIED_NO_THINGY, value_input_option="USER_ENTERED"
+        self.assert_values_updated(
+            "'gspread dataframe test'!A1:I10", CELL_LIST_STRINGIFIED_NO_THINGY
         )
 
     def test_include_index_true(self):
@@ -310,8 +409,8 @@ class TestWorksheetWrites(unittest.TestCase):
             string_escaping=re.compile(r"3e50").match,
         )
         self.sheet.resize.assert_called_once_with(10, 10)
-        self.sheet.update_cells.assert_called_once_with(
-            CELL_LIST_STRINGIFIED, value_input_option="USER_ENTERED"
+        self.assert_values_updated(
+            "'gspread dataframe test'!A1:J10", CELL_LIST_STRINGIFIED
         )
 
     def test_write_list_value_to_cell(self):
@@ -324,6 +423,282 @@ class TestWorksheetWrites(unittest.TestCase):
             string_escaping=re.compile(r"3e50").match,
         )
         self.sheet.resize.assert_called_once_with(10, 10)
-        self.sheet.update_cells.assert_called_once_with(
-            CELL_LIST_STRINGIFIED, value_input_option="USER_ENTERED"
+        self.assert_values_updated(
+            "'gspread dataframe test'!A1:J10", CELL_LIST_STRINGIFIED
+        )
+
+    def test_write_at_offset(self):
+        df = get_as_dataframe(self.sheet, na_filter=False)
+        set_with_dataframe(
+            self.sheet,
+            df,
+            row=3,
+            col=2,
+            string_escaping=re.compile(r"3e50").match,
+        )
+        self.sheet.resize.assert_called_once_with(12, 11)
+        self.assert_values_updated(
+            "'gspread dataframe test'!B3:K12", CELL_LIST_STRINGIFIED
+        )
+
+    def test_invalid_string_escaping_raises(self):
+        df = get_as_dataframe(self.sheet, na_filter=False)
+        self.assertRaises(
+            ValueError,
+            set_with_dataframe,
+            self.sheet,
+            df,
+            string_escaping="sometimes",
+        )
+        self.sheet.spreadsheet.values_update.assert_not_called()
+
+    def test_write_several_dataframes_in_one_request(self):
+        df = get_as_dataframe(self.sheet, na_filter=False)
+        df_small = pd.DataFrame({"a": [1, 2]})
+        set_with_dataframes(
+            self.sheet,
+            [df, df_small],
+            [1, 12],
+            string_escaping=re.compile(r"3e50").match,
+        )
+        self.sheet.resize.assert_called_once_with(14, None)
+        self.sheet.spreadsheet.values_update.assert_not_called()
+        self.sheet.spreadsheet.values_batch_update.assert_called_once_with(
+            body={
+                "valueInputOption": "USER_ENTERED",
+                "data": [
+                    {
+                        "range": "'gspread dataframe test'!A1:J10",
+                        "values": CELL_LIST_STRINGIFIED,
+                    },
+                    {
+                        "range": "'gspread dataframe test'!A12:A14",
+                        "values": [["a"], [1], [2]],
+                    },
+                ],
+            }
+        )
+
+    def test_write_datetime_column(self):
+        df = pd.DataFrame(
+            {"when": pd.to_datetime(["2017-03-04", None, "2017-03-05 10:00"])}
+        )
+        set_with_dataframe(self.sheet, df)
+        self.assert_values_updated(
+            "'gspread dataframe test'!A1:A4",
+            [["when"], ["2017-03-04 00:00:00"], [""], ["2017-03-05 10:00:00"]],
+        )
+
+    def test_write_multiindex(self):
+        df = pd.DataFrame(
+            {"value": [1.5, None]},
+            index=pd.MultiIndex.from_tuples(
+                [("a", 1), ("b", 2)], names=["letter", "number"]
+            ),
+        )
+        set_with_dataframe(self.sheet, df, include_index=True)
+        self.assert_values_updated(
+            "'gspread dataframe test'!A1:C3",
+            [["letter", "number", "value"], ["a", 1, 1.5], ["b", 2, ""]],
+        )
+
+    @patch("gspread_dataframe._MAX_CELLS_PER_REQUEST", 30)
+    def test_write_in_chunks(self):
+        df = get_as_dataframe(self.sheet, na_filter=False)
+        set_with_dataframe(
+            self.sheet,
+            df,
+            string_escaping=re.compile(r"3e50").match,
+        )
+        self.assertEqual(
+            self.sheet.spreadsheet.values_update.call_args_list,
+            [
+                call(
+                    "'gspread dataframe test'!A%d:J%d" % (start + 1, end),
+                    params={"valueInputOption": "USER_ENTERED"},
+                    body={"values": CELL_LIST_STRINGIFIED[start:end]},
+                )
+                for start, end in ((0, 3), (3, 6), (6, 9), (9, 10))
+            ],
+        )
+
+    @patch("gspread_dataframe._MAX_CELLS_PER_REQUEST", 33)
+    def test_write_several_dataframes_in_chunks(self):
+        df = get_as_dataframe(self.sheet, na_filter=False)
+        df_small = pd.DataFrame({"a": [1, 2]})
+        set_with_dataframes(
+            self.sheet,
+            [df_small, df],
+            [1, 5],
+            string_escaping=re.compile(r"3e50").match,
+        )
+        requests = [
+            [data["range"] for data in c[1]["body"]["data"]]
+            for c in self.sheet.spreadsheet.values_batch_update.call_args_list
+        ]
+        self.assertEqual(
+            requests,
+            [
+                [
+                    "'gspread dataframe test'!A1:A3",
+                    "'gspread dataframe test'!A5:J7",
+                ],
+                ["'gspread dataframe test'!A8:J10"],
+                ["'gspread dataframe test'!A11:J13"],
+                ["'gspread dataframe test'!A14:J14"],
+            ],
+        )
+
+    def test_write_mixed_dtypes(self):
+        df = pd.DataFrame(
+            {
+                "i": [1, 2],
+                "f": [0.5, np.nan],
+                "s": ["x", None],
+                "j": [3, 4],
+                "b": [True, False],
+            }
+        )
+        set_with_dataframe(self.sheet, df)
+        self.assert_values_updated(
+            "'gspread dataframe test'!A1:E3",
+            [
+                ["i", "f", "s", "j", "b"],
+                [1, 0.5, "x", 3, True],
+                [2, "", "", 4, False],
+            ],
+        )
+
+    def test_write_leaves_dataframe_unchanged(self):
+        df = pd.DataFrame(
+            {"s": ["=A1", "'q", None], "t": pd.array(["a", None, "'b"])},
+            index=pd.Index(["x", None, "'z"]),
+        )
+        original = df.copy()
+        set_with_dataframe(
+            self.sheet, df, include_index=True, allow_formulas=False
+        )
+        pd.testing.assert_frame_equal(df, original)
+        pd.testing.assert_index_equal(df.index, original.index)
+
+    def test_write_twice_sends_same_values(self):
+        df = get_as_dataframe(self.sheet, na_filter=False)
+        for _ in range(2):
+            set_with_dataframe(
+                self.sheet,
+                df,
+                include_index=True,
+                allow_formulas=False,
+                string_escaping="full",
+            )
+        first, second = self.sheet.spreadsheet.values_update.call_args_list
+        self.assertEqual(first, second)
+
+    def test_write_numeric_only(self):
+        df = pd.DataFrame({"x": [1.5, np.nan], "y": [2.0, 3.0]})
+        set_with_dataframe(self.sheet, df, include_column_header=False)
+        self.assert_values_updated(
+            "'gspread dataframe test'!A1:B2", [[1.5, 2.0], ["", 3.0]]
+        )
+
+    def test_write_several_dataframes_stacked(self):
+        df_a = pd.DataFrame({"a": [1, 2]})
+        df_b = pd.DataFrame({"b": ["x"], "c": ["y"]})
+        set_with_dataframes(self.sheet, [df_a, df_b])
+        self.sheet.spreadsheet.values_batch_update.assert_called_once_with(
+            body={
+                "valueInputOption": "USER_ENTERED",
+                "data": [
+                    {
+                        "range": "'gspread dataframe test'!A1:A3",
+                        "values": [["a"], [1], [2]],
+                    },
+                    {
+                        "range": "'gspread dataframe test'!A4:B5",
+                        "values": [["b", "c"], ["x", "y"]],
+                    },
+                ],
+            }
+        )
+
+    def test_write_non_finite_raises(self):
+        for df in (
+            pd.DataFrame({"x": [1.5, np.inf]}),
+            pd.DataFrame({"x": ["a", -np.inf]}),
+            pd.DataFrame({np.inf: [1]}),
+        ):
+            self.assertRaises(ValueError, set_with_dataframe, self.sheet, df)
+        self.sheet.spreadsheet.values_update.assert_not_called()
+
+
+@unittest.skipIf(gspread_dataframe.orjson is None, "orjson not installed")
+class TestWorksheetWritesWithOrjson(unittest.TestCase):
+    def setUp(self):
+        self.sheet = MockWorksheet()
+        self.sheet.resize = MagicMock()
+        self.sheet.spreadsheet.id = "spreadsheet_id"
+        self.sheet.spreadsheet.client = MagicMock()
+
+    def test_write_basic(self):
+        df = get_as_dataframe(self.sheet, na_filter=False)
+        set_with_dataframe(
+            self.sheet,
+            df,
+            string_escaping=re.compile(r"3e50").match,
+        )
+        request = self.sheet.spreadsheet.client.request
+        request.assert_called_once()
+        args, kwargs = request.call_args
+        self.assertEqual(args[0], "put")
+        self.assertTrue(
+            args[1].endswith(
+                "/spreadsheet_id/values/"
+                "%27gspread%20dataframe%20test%27%21A1%3AJ10"
+            )
+        )
+        self.assertEqual(
+            kwargs["params"], {"valueInputOption": "USER_ENTERED"}
+        )
+        self.assertEqual(
+            json.loads(kwargs["data"]), {"values": CELL_LIST_STRINGIFIED}
+        )
+
+    def test_write_several_dataframes(self):
+        df_small = pd.DataFrame({"a": [np.int64(1), 2]}, dtype=object)
+        set_with_dataframes(self.sheet, [df_small], [3])
+        request = self.sheet.spreadsheet.client.request
+        args, kwargs = request.call_args
+        self.assertEqual(args[0], "post")
+        self.assertTrue(args[1].endswith("/spreadsheet_id/values:batchUpdate"))
+        self.assertEqual(
+            json.loads(kwargs["data"]),
+            {
+                "valueInputOption": "USER_ENTERED",
+                "data": [
+                    {
+                        "range": "'gspread dataframe test'!A3:A5",
+                        "values": [["a"], [1], [2]],
+                    }
+                ],
+            },
+        )
+
+    def test_same_outcome_as_json_path(self):
+        self.sheet.spreadsheet.values_update = MagicMock()
+        big = pd.DataFrame({"a": ["x", 2 ** 70]})
+        set_with_dataframe(self.sheet, big)
+        with patch("gspread_dataframe.orjson", None):
+            set_with_dataframe(self.sheet, big)
+        with_orjson, without_orjson = (
+            self.sheet.spreadsheet.values_update.call_args_list
         )
+        self.assertEqual(with_orjson, without_orjson)
+        self.sheet.spreadsheet.client.request.assert_not_called()
+
+        infinite = pd.DataFrame({"a": [1.0, np.inf]})
+        self.assertRaises(ValueError, set_with_dataframe, self.sheet, infinite)
+        with patch("gspread_dataframe.orjson", None):
+            self.assertRaises(
+                ValueError, set_with_dataframe, self.sheet, infinite
+            )
+        self.sheet.spreadsheet.client.request.assert_not_called()
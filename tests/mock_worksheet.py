@@ -1,7 +1,6 @@
 import os.path
 import json
 import re
-from gspread.models import Cell
 from gspread_dataframe import _cellrepr
 
 
@@ -12,24 +11,18 @@ def contents_of_file(filename, et_parse=True):
 
 SHEET_CONTENTS_FORMULAS = contents_of_file("sheet_contents_formulas.json")
 SHEET_CONTENTS_EVALUATED = contents_of_file("sheet_contents_evaluated.json")
-CELL_LIST = [
-    Cell(row=i + 1, col=j + 1, value=value)
-    for i, row in enumerate(contents_of_file("cell_list.json"))
-    for j, value in enumerate(row)
-]
+CELL_LIST = contents_of_file("cell_list.json")
 
 CELL_LIST_STRINGIFIED = [
-    Cell(
-        row=i + 1,
-        col=j + 1,
-        value=_cellrepr(
+    [
+        _cellrepr(
             value,
             allow_formulas=True,
             string_escaping=re.compile(r"3e50").match,
-        ),
-    )
-    for i, row in enumerate(contents_of_file("cell_list.json"))
-    for j, value in enumerate(row)
+        )
+        for value in row
+    ]
+    for row in contents_of_file("cell_list.json")
 ]
 
 _without_index = contents_of_file("cell_list.json")
@@ -37,17 +30,15 @@ for _r in _without_index:
     del _r[0]
 
 CELL_LIST_STRINGIFIED_NO_THINGY = [
-    Cell(
-        row=i + 1,
-        col=j + 1,
-        value=_cellrepr(
+    [
+        _cellrepr(
             value,
             allow_formulas=True,
             string_escaping=re.compile(r"3e50").match,
-        ),
-    )
-    for i, row in enumerate(_without_index)
-    for j, value in enumerate(row)
+        )
+        for value in row
+    ]
+    for row in _without_index
 ]
 
 